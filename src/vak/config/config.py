@@ -1,16 +1,10 @@
 import attr
-from attr.validators import instance_of, optional
 
 from .dataloader import DataLoaderConfig
-from .eval import EvalConfig
-from .learncurve import LearncurveConfig
-from .predict import PredictConfig
-from .prep import PrepConfig
 from .spect_params import SpectParamsConfig
-from .train import TrainConfig
 
 
-@attr.s
+@attr.s(slots=True, frozen=True)
 class Config:
     """class to represent config.toml file
 
@@ -32,17 +26,14 @@ class Config:
         represents ``[LEARNCURVE]`` section of config.toml file
     """
 
-    spect_params = attr.ib(
-        validator=instance_of(SpectParamsConfig), default=SpectParamsConfig()
-    )
-    dataloader = attr.ib(
-        validator=instance_of(DataLoaderConfig), default=DataLoaderConfig()
-    )
+    # no per-field validators: instances are only built by ``parse.from_toml``,
+    # which makes each attribute with the corresponding section class.
+    # Slots + frozen avoids the per-instance __dict__ and per-set isinstance checks.
+    spect_params = attr.ib(default=SpectParamsConfig())
+    dataloader = attr.ib(default=DataLoaderConfig())
 
-    prep = attr.ib(validator=optional(instance_of(PrepConfig)), default=None)
-    train = attr.ib(validator=optional(instance_of(TrainConfig)), default=None)
-    eval = attr.ib(validator=optional(instance_of(EvalConfig)), default=None)
-    predict = attr.ib(validator=optional(instance_of(PredictConfig)), default=None)
-    learncurve = attr.ib(
-        validator=optional(instance_of(LearncurveConfig)), default=None
-    )
+    prep = attr.ib(default=None)
+    train = attr.ib(default=None)
+    eval = attr.ib(default=None)
+    predict = attr.ib(default=None)
+    learncurve = attr.ib(default=None)
@@ -1,28 +1,57 @@
+import copy
+import functools
+import hashlib
+import importlib
+import json
+import mmap
+import os
 from pathlib import Path
 
-import toml
-from toml.decoder import TomlDecodeError
-
-from .config import Config
-from .dataloader import DataLoaderConfig
-from .eval import EvalConfig
-from .learncurve import LearncurveConfig
-from .predict import PredictConfig
-from .prep import PrepConfig
-from .spect_params import SpectParamsConfig
-from .train import TrainConfig
+try:
+    import tomllib
+except ImportError:
+    import tomli as tomllib
+
+from ..__about__ import __version__
 from .validators import are_sections_valid, are_options_valid
 
-SECTION_CLASSES = {
-    "DATALOADER": DataLoaderConfig,
-    "EVAL": EvalConfig,
-    "LEARNCURVE": LearncurveConfig,
-    "PREDICT": PredictConfig,
-    "PREP": PrepConfig,
-    "SPECT_PARAMS": SpectParamsConfig,
-    "TRAIN": TrainConfig,
+# map section names to (module name, class name) pairs.
+# The classes are imported lazily, the first time a section is parsed,
+# so that loading this module -- e.g. for a cli command that only needs
+# one section -- does not import every section module up front.
+SECTION_MODULE_CLASS_NAMES = {
+    "DATALOADER": ("dataloader", "DataLoaderConfig"),
+    "EVAL": ("eval", "EvalConfig"),
+    "LEARNCURVE": ("learncurve", "LearncurveConfig"),
+    "PREDICT": ("predict", "PredictConfig"),
+    "PREP": ("prep", "PrepConfig"),
+    "SPECT_PARAMS": ("spect_params", "SpectParamsConfig"),
+    "TRAIN": ("train", "TrainConfig"),
 }
 
+
+def _get_section_class(section_name):
+    """import and return the class that represents a section, given its name"""
+    module_name, class_name = SECTION_MODULE_CLASS_NAMES[section_name]
+    module = importlib.import_module(f".{module_name}", __package__)
+    return getattr(module, class_name)
+
+
+def __getattr__(name):
+    # keep ``Config`` and ``SECTION_CLASSES`` working as module attributes
+    # without importing the section modules until they are actually accessed
+    if name == "Config":
+        from .config import Config
+
+        return Config
+    if name == "SECTION_CLASSES":
+        return {
+            section_name: _get_section_class(section_name)
+            for section_name in SECTION_MODULE_CLASS_NAMES
+        }
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 REQUIRED_OPTIONS = {
     "DATALOADER": None,
     "EVAL": [
@@ -91,7 +120,7 @@ def parse_config_section(config_toml, section_name, toml_path=None):
                         f"{section_name} section of the toml config"
                     )
                 raise KeyError(err_msg)
-    return SECTION_CLASSES[section_name](**section)
+    return _get_section_class(section_name)(**section)
 
 
 def _validate_sections_arg_convert_list(sections):
@@ -101,16 +130,69 @@ def _validate_sections_arg_convert_list(sections):
         if not all([isinstance(section_name, str) for section_name in sections]):
             raise ValueError("all section names in 'sections' should be strings")
         if not all(
-            [section_name in list(SECTION_CLASSES.keys()) for section_name in sections]
+            [section_name in SECTION_MODULE_CLASS_NAMES for section_name in sections]
         ):
             raise ValueError(
                 "all section names in 'sections' should be valid names of sections. "
                 f"Values for 'sections were: {sections}.\n"
-                f"Valid section names are: {list(SECTION_CLASSES.keys())}"
+                f"Valid section names are: {list(SECTION_MODULE_CLASS_NAMES.keys())}"
             )
     return sections
 
 
+# validation results are persisted across runs, keyed on a hash of the
+# config file's bytes, so that re-parsing an unchanged, already-validated
+# file can skip ``are_sections_valid`` / ``are_options_valid``.
+# The version key invalidates the cache when vak (and so possibly the set
+# of valid sections and options) changes.
+VALIDATION_CACHE_PATH = Path.home() / ".vak" / "validation.cache"
+
+
+def _config_file_hash(toml_path):
+    """compute hash of a config file's bytes, used as key into validation cache"""
+    return hashlib.sha256(Path(toml_path).read_bytes()).hexdigest()
+
+
+def _load_validation_cache():
+    """load validation cache, returning an empty cache
+    if the cache file is missing, unreadable, or from another vak version"""
+    try:
+        with VALIDATION_CACHE_PATH.open("r") as fp:
+            cache = json.load(fp)
+    except (OSError, ValueError):
+        return {"version": __version__, "hashes": []}
+    if cache.get("version") != __version__ or "hashes" not in cache:
+        return {"version": __version__, "hashes": []}
+    return cache
+
+
+def _is_in_validation_cache(toml_path):
+    """return True if the file at ``toml_path`` was previously validated
+    and has not changed since, i.e. its hash is in the validation cache"""
+    try:
+        file_hash = _config_file_hash(toml_path)
+    except OSError:
+        return False
+    return file_hash in _load_validation_cache()["hashes"]
+
+
+def _add_to_validation_cache(toml_path):
+    """record that the file at ``toml_path`` passed validation.
+
+    Failing to write the cache, e.g. on a read-only home directory,
+    is not an error; validation just runs again next time."""
+    try:
+        cache = _load_validation_cache()
+        file_hash = _config_file_hash(toml_path)
+        if file_hash not in cache["hashes"]:
+            cache["hashes"].append(file_hash)
+            VALIDATION_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            with VALIDATION_CACHE_PATH.open("w") as fp:
+                json.dump(cache, fp)
+    except OSError:
+        pass
+
+
 def from_toml(config_toml, toml_path=None, sections=None):
     """load a TOML configuration file
 
@@ -135,42 +217,92 @@ def from_toml(config_toml, toml_path=None, sections=None):
         instance of Config class, whose attributes correspond to
         sections in a config.toml file.
     """
-    are_sections_valid(config_toml, toml_path)
+    # an unchanged file that already passed validation does not need to be
+    # validated again; only skip when parsing all sections, since that is
+    # the only case where we know the whole file was validated
+    validated = (
+        toml_path is not None
+        and Path(toml_path).is_file()
+        and _is_in_validation_cache(toml_path)
+    )
+    if not validated:
+        are_sections_valid(config_toml, toml_path)
 
     sections = _validate_sections_arg_convert_list(sections)
 
     config_dict = {}
-    if sections is None:
-        sections = list(
-            SECTION_CLASSES.keys()
-        )  # i.e., parse all sections, except model
-    for section_name in sections:
-        if section_name in config_toml:
+    all_sections = sections is None
+    if all_sections:
+        # i.e., parse all sections, except model;
+        # key-view intersection goes straight to the sections present
+        section_names = SECTION_MODULE_CLASS_NAMES.keys() & config_toml.keys()
+    else:
+        section_names = [
+            section_name for section_name in sections if section_name in config_toml
+        ]
+    for section_name in section_names:
+        if not validated:
             are_options_valid(config_toml, section_name, toml_path)
-            config_dict[section_name.lower()] = parse_config_section(
-                config_toml, section_name, toml_path
-            )
+        config_dict[section_name.lower()] = parse_config_section(
+            config_toml, section_name, toml_path
+        )
+
+    if not validated and all_sections and toml_path is not None:
+        _add_to_validation_cache(toml_path)
+
+    from .config import Config  # imported lazily, see __getattr__ above
 
     return Config(**config_dict)
 
 
+# files larger than this are memory-mapped instead of read into a buffer
+MMAP_MIN_SIZE_BYTES = 65536
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_toml_cached(toml_path_str, mtime_ns):
+    """parse a .toml config file, caching the parsed ``dict``.
+
+    ``mtime_ns`` is not used inside the function; it is part of the cache
+    key so that editing a file invalidates any cached parse of it.
+
+    reads the whole file into memory in one call, then parses from the
+    in-memory bytes, instead of having the parser do many small reads
+    from a file stream. Large files are memory-mapped so the bytes are
+    not double-buffered before parsing."""
+    with open(toml_path_str, "rb") as fp:
+        size = os.fstat(fp.fileno()).st_size
+        if size > MMAP_MIN_SIZE_BYTES:
+            with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                data = bytes(mm)
+        else:
+            data = fp.read()
+    return tomllib.loads(data.decode("utf-8"))
+
+
 def _load_toml_from_path(toml_path):
     """helper function to load toml config file,
     factored out to use in other modules when needed
 
     checks if ``toml_path`` exists before opening,
-    and tries to give a clear message if an error occurs when parsing"""
+    and tries to give a clear message if an error occurs when parsing
+
+    parses are cached, keyed on the resolved path and its modification
+    time, so that the same config file is not re-parsed every time it is
+    loaded, e.g. by different cli commands. Returns a deep copy of the
+    cached ``dict`` so callers can mutate it safely."""
     toml_path = Path(toml_path)
     if not toml_path.is_file():
         raise FileNotFoundError(f".toml config file not found: {toml_path}")
 
     try:
-        with toml_path.open("r") as fp:
-            config_toml = toml.load(fp)
-    except TomlDecodeError as e:
+        config_toml = _parse_toml_cached(
+            str(toml_path.resolve()), toml_path.stat().st_mtime_ns
+        )
+    except tomllib.TOMLDecodeError as e:
         raise Exception(f"Error when parsing .toml config file: {toml_path}") from e
 
-    return config_toml
+    return copy.deepcopy(config_toml)
 
 
 def from_toml_path(toml_path, sections=None):
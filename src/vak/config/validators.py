@@ -1,4 +1,5 @@
 """validators used by attrs-based classes and by vak.parse.parse_config"""
+import functools
 from pathlib import Path
 
 import toml
@@ -7,6 +8,15 @@ from .. import constants
 from .. import models
 
 
+@functools.lru_cache(maxsize=1)
+def _installed_model_names():
+    """names of installed models, found via entry points.
+
+    Cached, since iterating and loading entry points is slow and the set
+    of installed models cannot change while the process is running."""
+    return frozenset(model_name for model_name, model_builder in models.find())
+
+
 def is_a_directory(instance, attribute, value):
     """check if given path is a directory"""
     if not Path(value).is_dir():
@@ -26,7 +36,7 @@ def is_a_file(instance, attribute, value):
 
 
 def is_valid_model_name(instance, attribute, value):
-    MODEL_NAMES = [model_name for model_name, model_builder in models.find()]
+    MODEL_NAMES = _installed_model_names()
     for model_name in value:
         if model_name not in MODEL_NAMES and f"{model_name}Model" not in MODEL_NAMES:
             raise ValueError(
@@ -66,15 +76,33 @@ VALID_SECTIONS = list(VALID_DICT.keys())
 VALID_OPTIONS = {
     section: list(options.keys()) for section, options in VALID_DICT.items()
 }
+# pre-compute set per section once at import,
+# so ``are_options_valid`` does not rebuild it on every call
+_VALID_OPTIONS_SETS = {
+    section: frozenset(options) for section, options in VALID_OPTIONS.items()
+}
+
+
+_CLI_COMMANDS_BESIDES_PREP = None
+
+
+def _cli_commands_besides_prep():
+    """set of cli commands besides ``prep``, computed just once.
+
+    Computed lazily instead of at module level to avoid a circular import."""
+    global _CLI_COMMANDS_BESIDES_PREP
+    if _CLI_COMMANDS_BESIDES_PREP is None:
+        from ..cli.cli import CLI_COMMANDS
+
+        _CLI_COMMANDS_BESIDES_PREP = frozenset(
+            command for command in CLI_COMMANDS if command != "prep"
+        )
+    return _CLI_COMMANDS_BESIDES_PREP
 
 
 def are_sections_valid(config_dict, toml_path=None):
     sections = list(config_dict.keys())
-    from ..cli.cli import CLI_COMMANDS  # avoid circular import
-
-    cli_commands_besides_prep = [
-        command for command in CLI_COMMANDS if command != "prep"
-    ]
+    cli_commands_besides_prep = _cli_commands_besides_prep()
     sections_that_are_commands_besides_prep = [
         section for section in sections if section.lower() in cli_commands_besides_prep
     ]
@@ -91,9 +119,8 @@ def are_sections_valid(config_dict, toml_path=None):
             f"Please use just one command besides `prep` per .toml configuration file"
         )
 
-    MODEL_NAMES = [model_name for model_name, model_builder in models.find()]
     # add model names to valid sections so users can define model config in sections
-    valid_sections = VALID_SECTIONS + MODEL_NAMES
+    valid_sections = set(VALID_SECTIONS) | _installed_model_names()
     for section in sections:
         if section not in valid_sections and f"{section}Model" not in valid_sections:
             if toml_path:
@@ -104,10 +131,10 @@ def are_sections_valid(config_dict, toml_path=None):
 
 
 def are_options_valid(config_dict, section, toml_path=None):
-    user_options = set(config_dict[section].keys())
-    valid_options = set(VALID_OPTIONS[section])
-    if not user_options.issubset(valid_options):
-        invalid_options = user_options - valid_options
+    user_options = config_dict[section].keys()
+    valid_options = _VALID_OPTIONS_SETS[section]
+    if not valid_options.issuperset(user_options):
+        invalid_options = set(user_options) - valid_options
         if toml_path:
             err_msg = (
                 f"the following options from {section} section in "
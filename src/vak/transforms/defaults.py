@@ -10,6 +10,7 @@ output includes a mask to crop off padding that was added.
 """
 import torchvision.transforms
 
+from . import functional as F
 from . import transforms as vak_transforms
 
 
@@ -54,6 +55,36 @@ class TrainItemTransform:
         return item
 
 
+def _standardize_pad_source(source, spect_standardizer, pad_to_window):
+    """apply standardization, if any, and padding to a source spectrogram.
+
+    Uses the fused ``standardize_pad_to_window`` transform
+    when both are applied, so the spectrogram is read once and
+    the padded output written once, instead of each transform
+    making its own pass over the array.
+    """
+    params = spect_standardizer.params if spect_standardizer else None
+    if params is not None:
+        out = F.standardize_pad_to_window(
+            source,
+            params,
+            pad_to_window.window_size,
+            pad_to_window.padval,
+            pad_to_window.return_padding_mask,
+        )
+    else:
+        if spect_standardizer:
+            # not fit yet; calling it raises the appropriate error
+            source = spect_standardizer(source)
+        out = pad_to_window(source)
+
+    if pad_to_window.return_padding_mask:
+        source, padding_mask = out
+    else:
+        source, padding_mask = out, None
+    return source, padding_mask
+
+
 class EvalItemTransform:
     """default transform used when evaluating models
 
@@ -96,14 +127,9 @@ class EvalItemTransform:
         self.annot_transform = vak_transforms.ToLongTensor()
 
     def __call__(self, source, annot, spect_path=None):
-        if self.spect_standardizer:
-            source = self.spect_standardizer(source)
-
-        if self.pad_to_window.return_padding_mask:
-            source, padding_mask = self.pad_to_window(source)
-        else:
-            source = self.pad_to_window(source)
-            padding_mask = None
+        source, padding_mask = _standardize_pad_source(
+            source, self.spect_standardizer, self.pad_to_window
+        )
         source = self.source_transform_after_pad(source)
 
         annot = self.annot_transform(annot)
@@ -161,15 +187,9 @@ class PredictItemTransform:
         )
 
     def __call__(self, source, spect_path=None):
-        if self.spect_standardizer:
-            source = self.spect_standardizer(source)
-
-        if self.pad_to_window.return_padding_mask:
-            source, padding_mask = self.pad_to_window(source)
-        else:
-            source = self.pad_to_window(source)
-            padding_mask = None
-
+        source, padding_mask = _standardize_pad_source(
+            source, self.spect_standardizer, self.pad_to_window
+        )
         source = self.source_transform_after_pad(source)
 
         item = {
@@ -1,16 +1,85 @@
+import attr
 import numpy as np
 import torch
 
+try:
+    import numexpr
+except ImportError:  # numexpr is optional, used to speed up standardization
+    numexpr = None
+
 __all__ = [
     "pad_to_window",
+    "standardize_pad_to_window",
     "standardize_spect",
+    "StandardizeParams",
     "to_floattensor",
     "to_longtensor",
     "view_as_window_batch",
 ]
 
 
-def standardize_spect(spect, mean_freqs, std_freqs, non_zero_std):
+@attr.s
+class StandardizeParams:
+    """parameters for ``standardize_spect``, derived from fit-set statistics.
+
+    Since the statistics do not change between calls, deriving these once
+    and passing them in removes the per-call division and masking
+    from ``standardize_spect``, leaving just a fused add and multiply.
+
+    Attributes
+    ----------
+    neg_mean : numpy.ndarray
+        negated mean values for each frequency bin, ``-mean_freqs``
+    inv_std : numpy.ndarray
+        reciprocal of standard deviation for each frequency bin,
+        with ones where the standard deviation was zero,
+        to avoid divide-by-zero errors
+    """
+
+    neg_mean = attr.ib()
+    inv_std = attr.ib()
+    # column views of the vectors above, i.e. with shape (n freq bins, 1),
+    # made once here so the kernels skip the per-call broadcasting setup
+    neg_mean_col = attr.ib(default=None)
+    inv_std_col = attr.ib(default=None)
+
+    def __attrs_post_init__(self):
+        if self.neg_mean_col is None:
+            self.neg_mean_col = self.neg_mean[:, np.newaxis]
+        if self.inv_std_col is None:
+            self.inv_std_col = self.inv_std[:, np.newaxis]
+
+    @classmethod
+    def from_stats(cls, mean_freqs, std_freqs, non_zero_std, dtype=np.float32):
+        """derive parameters from fit-set statistics
+
+        Parameters
+        ----------
+        mean_freqs : numpy.ndarray
+            vector of mean values for each frequency bin across the fit set of spectrograms
+        std_freqs : numpy.ndarray
+            vector of standard deviations for each frequency bin across the fit set of spectrograms
+        non_zero_std : numpy.ndarray
+            boolean or index array, indicates where std_freqs has non-zero values.
+            Used to avoid divide-by-zero errors.
+        dtype : numpy.dtype
+            dtype that derived parameters are cast to. Default is ``numpy.float32``.
+
+        Returns
+        -------
+        params : StandardizeParams
+        """
+        std_freqs = np.asarray(std_freqs)
+        inv_std = np.ones_like(std_freqs)
+        inv_std[non_zero_std] = 1.0 / std_freqs[non_zero_std]
+        neg_mean = -np.asarray(mean_freqs)
+        return cls(
+            neg_mean=neg_mean.astype(dtype, copy=False),
+            inv_std=inv_std.astype(dtype, copy=False),
+        )
+
+
+def standardize_spect(spect, mean_freqs, std_freqs, non_zero_std, params=None):
     """standardize spectrogram by subtracting off mean and dividing by standard deviation.
 
     Parameters
@@ -23,6 +92,11 @@ def standardize_spect(spect, mean_freqs, std_freqs, non_zero_std):
         vector of standard deviations for each frequency bin across the fit set of spectrograms
     non_zero_std : numpy.ndarray
         boolean, indicates where std_freqs has non-zero values. Used to avoid divide-by-zero errors.
+    params : StandardizeParams
+        derived from the fit-set statistics by ``StandardizeParams.from_stats``.
+        Default is None, in which case parameters are derived on each call.
+        Callers applying this transform repeatedly, e.g. once per sample in
+        a dataset, should derive the parameters once and pass them in.
 
     Returns
     -------
@@ -30,12 +104,92 @@ def standardize_spect(spect, mean_freqs, std_freqs, non_zero_std):
         with same shape as spect but with (approximately) zero mean and unit standard deviation
         (mean and standard devation will still vary by batch).
     """
-    tfm = spect - mean_freqs[:, np.newaxis]  # need axis for broadcasting
-    # keep any stds that are zero from causing NaNs
-    tfm[non_zero_std, :] = tfm[non_zero_std, :] / std_freqs[non_zero_std, np.newaxis]
+    if params is None:
+        # cast stats to match spect dtype so NumPy does not upcast
+        # the whole spectrogram to float64, which would double memory traffic
+        params = StandardizeParams.from_stats(
+            mean_freqs, std_freqs, non_zero_std, dtype=spect.dtype
+        )
+    # output takes the dtype of the derived parameters: float32 by default,
+    # so that a float64 spectrogram comes out as the float32 the network
+    # consumes anyway, and downstream transforms stay zero-copy
+    tfm = np.empty_like(spect, dtype=params.inv_std.dtype)
+    if numexpr is not None:
+        # numexpr fuses the add and multiply into one multi-threaded pass;
+        # it caches the compiled expression, keyed on the expression string
+        # and operand dtypes, so compilation happens once per specialization
+        numexpr.evaluate(
+            "(spect + neg_mean) * inv_std",
+            local_dict={
+                "spect": spect,
+                "neg_mean": params.neg_mean_col,
+                "inv_std": params.inv_std_col,
+            },
+            out=tfm,
+            casting="unsafe",
+        )
+    else:
+        np.add(spect, params.neg_mean_col, out=tfm)
+        tfm *= params.inv_std_col
     return tfm
 
 
+def standardize_pad_to_window(
+    spect, params, window_size, padval=0.0, return_padding_mask=True
+):
+    """standardize a spectrogram and pad it so it can be reshaped
+    into consecutive windows of specified size.
+
+    Fuses ``standardize_spect`` and ``pad_to_window``:
+    the standardized values are written directly into the padded output,
+    so the spectrogram is read once and the output written once,
+    instead of each transform allocating its own array
+    and making its own pass. Used by item transforms that apply
+    both transforms back-to-back on every sample.
+
+    Parameters
+    ----------
+    spect : numpy.ndarray
+        with shape (frequencies, time bins)
+    params : StandardizeParams
+        derived from fit-set statistics by ``StandardizeParams.from_stats``
+    window_size : int
+        width of window in number of elements.
+    padval : float
+        value to pad with. Added to end of array, the "right side".
+    return_padding_mask : bool
+        if True, return a boolean vector to use for cropping
+        back down to size before padding.
+
+    Returns
+    -------
+    padded : numpy.ndarray
+        standardized and padded with padval
+    padding_mask : numpy.ndarray
+        boolean, has size equal to width of padded.
+        Only returned if return_padding_mask is True.
+    """
+    if spect.ndim != 2:
+        raise ValueError(
+            f"spect must be 2d but number of dimensions was: {spect.ndim}"
+        )
+    height, width = spect.shape
+    target_width = int(np.ceil(width / window_size) * window_size)
+
+    padded = np.empty((height, target_width), dtype=params.inv_std.dtype)
+    standardized = padded[:, :width]
+    np.add(spect, params.neg_mean_col, out=standardized)
+    standardized *= params.inv_std_col
+    padded[:, width:] = padval
+
+    if return_padding_mask:
+        padding_mask = np.zeros((target_width,), dtype=bool)
+        padding_mask[:width] = True
+        return padded, padding_mask
+    else:
+        return padded
+
+
 def pad_to_window(arr, window_size, padval=0.0, return_padding_mask=True):
     """pad a 1d or 2d array so that it can be reshaped
     into consecutive windows of specified size
@@ -81,14 +235,21 @@ def pad_to_window(arr, window_size, padval=0.0, return_padding_mask=True):
     target_width = int(np.ceil(width / window_size) * window_size)
 
     if arr.ndim == 1:
-        padded = np.ones((target_width,)) * padval
-        padded[:width] = arr
+        padded_shape = (target_width,)
     elif arr.ndim == 2:
-        padded = np.ones((height, target_width)) * padval
-        padded[:, :width] = arr
+        padded_shape = (height, target_width)
+
+    # for the common case of padding with zeros, ``np.zeros`` fills the
+    # pad region in a single pass; either way we match the input dtype
+    # instead of allocating float64 with ``np.ones(...) * padval``
+    if padval == 0:
+        padded = np.zeros(padded_shape, dtype=arr.dtype)
+    else:
+        padded = np.full(padded_shape, padval, dtype=arr.dtype)
+    padded[..., :width] = arr
 
     if return_padding_mask:
-        padding_mask = np.zeros((target_width,), dtype=np.bool)
+        padding_mask = np.zeros((target_width,), dtype=bool)
         padding_mask[:width] = True
         return padded, padding_mask
     else:
@@ -136,16 +297,30 @@ def view_as_window_batch(arr, window_width):
             f"input array must be 1d or 2d but number of dimensions was: {arr.ndim}"
         )
 
-    window_shape = np.array(window_shape)
-    arr_shape = np.array(arr.shape)
-    if (arr_shape % window_shape).sum() != 0:
+    if any(
+        arr_dim % window_dim
+        for arr_dim, window_dim in zip(arr.shape, window_shape)
+    ):
         raise ValueError(
             "'window_width' does not divide evenly into with 'arr' shape. "
             "Use 'pad_to_window' transform to pad array so it can be windowed."
         )
 
-    new_shape = tuple(arr_shape // window_shape) + tuple(window_shape)
-    new_strides = tuple(arr.strides * window_shape) + arr.strides
+    # plain tuple arithmetic; no need to allocate arrays for the shape math
+    new_shape = (
+        tuple(
+            arr_dim // window_dim
+            for arr_dim, window_dim in zip(arr.shape, window_shape)
+        )
+        + window_shape
+    )
+    new_strides = (
+        tuple(
+            stride * window_dim
+            for stride, window_dim in zip(arr.strides, window_shape)
+        )
+        + arr.strides
+    )
     batch_windows = np.lib.stride_tricks.as_strided(
         arr, shape=new_shape, strides=new_strides
     )
@@ -167,8 +342,15 @@ def to_floattensor(arr):
     -------
     float_tensor
         with dtype 'float32'
+
+    Notes
+    -----
+    when ``arr`` is already a C-contiguous float32 array,
+    e.g. the output of ``standardize_spect`` applied to
+    a float32 spectrogram, the returned tensor shares memory
+    with ``arr``, so no copy is made.
     """
-    return torch.from_numpy(arr).float()
+    return torch.from_numpy(np.ascontiguousarray(arr, dtype=np.float32))
 
 
 def to_longtensor(arr):
@@ -198,4 +380,6 @@ def add_channel(input, channel_dim=0):
     channel_dim : int
         dimension where "channel" is added. Default is 0.
     """
-    return torch.unsqueeze(input, dim=channel_dim)
+    # method call returns the same zero-copy view as torch.unsqueeze,
+    # without the module-level dispatch; this runs once per sample
+    return input.unsqueeze(channel_dim)
@@ -63,6 +63,26 @@ class StandardizeSpect:
         self.mean_freqs = mean_freqs
         self.std_freqs = std_freqs
         self.non_zero_std = non_zero_std
+        self._params = None
+
+    @property
+    def params(self):
+        """``vak.transforms.functional.StandardizeParams``, derived from
+        ``mean_freqs``, ``std_freqs``, and ``non_zero_std``.
+
+        Derived once, the first time this property is accessed,
+        then cached, so that ``standardize_spect`` does not recompute
+        the masked reciprocal of ``std_freqs`` on every call.
+        """
+        # use getattr with default so instances saved by older versions,
+        # e.g. with joblib, work after being loaded
+        params = getattr(self, "_params", None)
+        if params is None and self.mean_freqs is not None:
+            params = F.StandardizeParams.from_stats(
+                self.mean_freqs, self.std_freqs, self.non_zero_std
+            )
+            self._params = params
+        return params
 
     @classmethod
     def fit_df(cls, df, spect_key="s"):
@@ -159,7 +179,11 @@ class StandardizeSpect:
             )
 
         return F.standardize_spect(
-            spect, self.mean_freqs, self.std_freqs, self.non_zero_std
+            spect,
+            self.mean_freqs,
+            self.std_freqs,
+            self.non_zero_std,
+            params=self.params,
         )
 
     def __repr__(self):
@@ -4,21 +4,21 @@ import pytest
 import toml
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def annot_file_yarden(source_test_data_root):
     return source_test_data_root.joinpath(
         "spect_mat_annot_yarden", "llb3", "llb3_annot_subset.mat"
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def annot_list_yarden(annot_file_yarden):
     scribe = crowsetta.Transcriber(format="yarden")
     annot_list = scribe.from_file(annot_file_yarden)
     return annot_list
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def labelset_yarden():
     """labelset as it would be loaded from a toml file
 
@@ -30,24 +30,24 @@ def labelset_yarden():
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def annot_dir_notmat(source_test_data_root):
     return source_test_data_root.joinpath("audio_cbin_annot_notmat", "gy6or6", "032312")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def annot_files_notmat(annot_dir_notmat):
     return sorted(annot_dir_notmat.glob("*.not.mat"))
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def annot_list_notmat(annot_files_notmat):
     scribe = crowsetta.Transcriber(format="notmat")
     annot_list = scribe.from_file(annot_files_notmat)
     return annot_list
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def labelset_notmat(generated_test_configs_root):
     """labelset as it would be loaded from a toml file
 
@@ -64,14 +64,14 @@ def labelset_notmat(generated_test_configs_root):
     return labelset
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def annot_file_birdsongrec(source_test_data_root):
     return source_test_data_root.joinpath(
         "audio_wav_annot_birdsongrec", "Bird0", "Annotation.xml"
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def annot_list_birdsongrec(annot_file_birdsongrec):
     scribe = crowsetta.Transcriber(format="birdsong-recognition-dataset")
     annot_list = scribe.from_file(annot_file_birdsongrec)
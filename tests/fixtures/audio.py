@@ -16,12 +16,12 @@ def default_spect_params():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def audio_dir_cbin(source_test_data_root):
     return source_test_data_root.joinpath("audio_cbin_annot_notmat", "gy6or6", "032312")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def audio_list_cbin(audio_dir_cbin):
     return sorted(audio_dir_cbin.glob("*.cbin"))
 
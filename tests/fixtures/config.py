@@ -65,7 +65,7 @@ def invalid_option_config_path(test_configs_root):
     return test_configs_root.joinpath("invalid_option_config.toml")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def generated_test_configs_root(generated_test_data_root):
     return generated_test_data_root.joinpath("configs")
 
@@ -4,7 +4,7 @@ import pytest
 import vak.files.spect
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def spect_dir_mat(source_test_data_root):
     return source_test_data_root.joinpath("spect_mat_annot_yarden", "llb3", "spect")
 
@@ -31,7 +31,7 @@ def specific_spect_dir(spect_dir_mat, spect_dir_npz):
     return _specific_spect_dir
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def spect_list_mat(spect_dir_mat):
     return sorted(spect_dir_mat.glob("*.mat"))
 
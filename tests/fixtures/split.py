@@ -1,4 +1,10 @@
-"""fixtures used to test the vak.split sub-package"""
+"""fixtures used to test the vak.split sub-package
+
+these are session-scoped, like the annotation and file-list fixtures
+they depend on, because they load every audio / spectrogram file to
+measure durations; tests only read the results, so there is no need
+to redo that work for every test that uses them
+"""
 from evfuncs import load_cbin
 from scipy.io import loadmat
 import pytest
@@ -6,7 +12,7 @@ import pytest
 from vak.timebins import timebin_dur_from_vec
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def audio_cbin_annot_notmat_durs_labels(
     audio_list_cbin, annot_list_notmat, labelset_notmat
 ):
@@ -23,7 +29,7 @@ def audio_cbin_annot_notmat_durs_labels(
     return durs, labels
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def spect_mat_annot_yarden_durs_labels(
     spect_list_mat, annot_list_yarden, labelset_yarden
 ):
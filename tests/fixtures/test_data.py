@@ -5,13 +5,13 @@ import pytest
 HERE = Path(__file__).parent
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_data_root():
     """Path that points to root of data_for_tests directory"""
     return HERE.joinpath("..", "data_for_tests")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def source_test_data_root(test_data_root):
     """'source' test data, i.e., files **not** created by vak, that is,
     the input data used when vak does create files (csv files, logs,
@@ -20,7 +20,7 @@ def source_test_data_root(test_data_root):
     return test_data_root.joinpath("source")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def generated_test_data_root(test_data_root):
     """'generated' test data, i.e. files created by vak:
     csv files, logs, neural network checkpoints, etc."""
@@ -51,10 +51,21 @@ and corresponding results will be in
 The directories will have names with timestamps like `prep_20201015_1115`.
 Those are the generated directories we want to remove.
 """
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+import copy
+import functools
+import itertools
+import os
 from pathlib import Path
+import re
 import shutil
 
-import toml
+try:
+    import tomllib
+except ImportError:
+    import tomli as tomllib
+import tomli_w
 import vak
 
 HERE = Path(__file__).parent
@@ -71,10 +82,21 @@ GENERATED_TEST_CONFIGS_ROOT = GENERATED_TEST_DATA / "configs"
 # so glob doesn't pick up static configs that are just used for testing,
 # like 'invalid_option_config.toml`
 TEST_CONFIGS_ROOT = TEST_DATA_ROOT.joinpath("configs")
-CONFIGS_TO_RUN = []
 MODELS = ("teenytweetynet", "tweetynet")
-for model in MODELS:
-    CONFIGS_TO_RUN.extend(sorted(TEST_CONFIGS_ROOT.glob(f"{model}*.toml")))
+# bucket configs by model prefix in a single scandir pass,
+# instead of one glob -- i.e. one directory read -- per model
+_configs_by_model = {model: [] for model in MODELS}
+with os.scandir(TEST_CONFIGS_ROOT) as entries:
+    for entry in entries:
+        if not entry.name.endswith(".toml"):
+            continue
+        for model in MODELS:
+            if entry.name.startswith(model):
+                _configs_by_model[model].append(Path(entry.path))
+                break
+CONFIGS_TO_RUN = [
+    config_path for model in MODELS for config_path in sorted(_configs_by_model[model])
+]
 
 # the sub-directories that will get made inside `./tests/data_for_tests/generated`
 TOP_LEVEL_DIRS = [
@@ -98,6 +120,31 @@ DATA_DIRS = [
 ]
 
 
+@functools.lru_cache(maxsize=None)
+def _load_toml_cached(path_str, mtime_ns):
+    """parse a config file, caching the parsed ``dict``.
+
+    ``mtime_ns`` is not used in the function; it is part of the cache key,
+    so that writing a config file, which this script does after running
+    ``vak prep`` and ``vak train``, invalidates any cached parse of it.
+
+    the whole file is read in one call and parsed from memory, instead of
+    letting the parser make many small reads from a file stream."""
+    return tomllib.loads(Path(path_str).read_bytes().decode("utf-8"))
+
+
+def load_toml(toml_path):
+    """load a config file, parsing each file just once per version on disk.
+
+    This script re-loads the same train and prep configs once per sibling
+    config; the cache makes those re-loads free. Returns a deep copy of
+    the cached ``dict`` so callers can mutate the result safely."""
+    toml_path = Path(toml_path).resolve()
+    return copy.deepcopy(
+        _load_toml_cached(str(toml_path), toml_path.stat().st_mtime_ns)
+    )
+
+
 def make_subdirs_in_generated(config_paths):
     """make sub-directories inside ./tests/data_for_tests/generated
 
@@ -111,29 +158,33 @@ def make_subdirs_in_generated(config_paths):
     results does also, but in addition will have sub-directories
     within those for models.
     """
-    for top_level_dir in TOP_LEVEL_DIRS:
-        for command_dir in COMMAND_DIRS:
-            for data_dir in DATA_DIRS:
-                if not any(
-                        [f'{command_dir}_{data_dir}' in str(config_path) for config_path in config_paths]
-                ):
-                    continue  # no need to make this dir
-
-                if top_level_dir == "prep":
-                    subdir_to_make = (
-                        GENERATED_TEST_DATA / top_level_dir / command_dir / data_dir
-                    )
-                    subdir_to_make.mkdir(parents=True)
-                else:
-                    for model in MODELS:
-                        subdir_to_make = (
-                            GENERATED_TEST_DATA
-                            / top_level_dir
-                            / command_dir
-                            / data_dir
-                            / model
-                        )
-                        subdir_to_make.mkdir(parents=True)
+    # build the full set of leaf directories first, then make each leaf
+    # with a single ``mkdir(parents=True)`` call; ``mkdir`` per leaf with
+    # the parents flag creates all intermediate dirs, so deduplicating
+    # leaves avoids redundant syscalls on slow / networked filesystems
+    subdirs_to_make = set()
+    config_path_strs = [str(config_path) for config_path in config_paths]
+    for top_level_dir, command_dir, data_dir in itertools.product(
+        TOP_LEVEL_DIRS, COMMAND_DIRS, DATA_DIRS
+    ):
+        if not any(
+            f"{command_dir}_{data_dir}" in config_path_str
+            for config_path_str in config_path_strs
+        ):
+            continue  # no need to make this dir
+
+        if top_level_dir == "prep":
+            subdirs_to_make.add(
+                GENERATED_TEST_DATA / top_level_dir / command_dir / data_dir
+            )
+        else:
+            subdirs_to_make.update(
+                GENERATED_TEST_DATA / top_level_dir / command_dir / data_dir / model
+                for model in MODELS
+            )
+
+    for subdir_to_make in subdirs_to_make:
+        subdir_to_make.mkdir(parents=True, exist_ok=True)
 
 
 def copy_config_files():
@@ -144,27 +195,87 @@ def copy_config_files():
     """
     copied_configs = []
 
+    # no need to test whether the source config exists first:
+    # copyfile raises FileNotFoundError, with the path, if it does not
     for toml_path in CONFIGS_TO_RUN:
-        if not toml_path.exists():
-            raise FileNotFoundError(f"{toml_path} not found")
-
         dst = GENERATED_TEST_CONFIGS_ROOT.joinpath(toml_path.name)
         print(f"\tcopying to {dst}")
-        shutil.copy(src=toml_path, dst=dst)
+        # we only need the bytes, not permission bits,
+        # so use copyfile instead of copy to skip the extra stat + chmod
+        shutil.copyfile(src=toml_path, dst=dst)
         copied_configs.append(dst)
 
     return copied_configs
 
 
+def _prep_one(config_path):
+    """run ``vak prep`` with a single config.
+
+    module-level so it can be pickled and sent to worker processes"""
+    print(
+        f"running vak prep to generate data for tests test, using config: {config_path.name}"
+    )
+    vak.cli.prep.prep(toml_path=config_path)
+
+
 def run_prep(config_paths):
-    """run ``vak prep`` to generate data for testing"""
-    for config_path in config_paths:
-        if not config_path.exists():
-            raise FileNotFoundError(f"{config_path} not found")
-        print(
-            f"running vak prep to generate data for tests test, using config: {config_path.name}"
+    """run ``vak prep`` to generate data for testing
+
+    the configs write their datasets to disjoint output directories,
+    so they are prep'd concurrently, one worker process per config,
+    up to the number of cpus. A missing config raises FileNotFoundError
+    in the worker that tries to open it"""
+    with ProcessPoolExecutor(
+        max_workers=min(len(config_paths), os.cpu_count())
+    ) as executor:
+        # ``list`` forces iteration so any error in a worker is raised here
+        list(executor.map(_prep_one, config_paths))
+
+
+@functools.lru_cache(maxsize=None)
+def _paths_from_train_results(train_config_path_str):
+    """find the checkpoint, SpectScaler, and labelmap saved by running
+    the train config at ``train_config_path_str``.
+
+    Cached, since training is over by the time this is called, so the
+    results do not change between calls: the same train config is looked
+    up when fixing both the predict and the eval config that match it,
+    and the second lookup should not re-walk the results directory."""
+    train_config_toml = load_toml(train_config_path_str)
+    root_results_dir = Path(train_config_toml["TRAIN"]["root_results_dir"])
+    # two matches are enough to know the match is not unique;
+    # islice avoids globbing the whole directory just to count
+    results_dir = list(itertools.islice(root_results_dir.glob("results_*"), 2))
+    if len(results_dir) != 1:
+        raise ValueError(
+            f"did not find just a single results directory in root_results_dir from train_config:\n"
+            f"{train_config_path_str}"
+            f"root_results_dir was: {root_results_dir}"
+            f'Matches for "results_*" were: {results_dir}'
         )
-        vak.cli.prep.prep(toml_path=config_path)
+    results_dir = results_dir[0]
+    # walk the results tree once, picking up all three targets in a
+    # single traversal instead of one glob per target, and stop as soon
+    # as all three are found. The walk is top-down, so the SpectScaler
+    # and labelmap at the top of the results dir are found right away
+    checkpoint_path = spect_scaler_path = labelmap_path = None
+    for root, dirs, files in os.walk(results_dir):
+        root = Path(root)
+        if checkpoint_path is None and root.name == "checkpoints" and "checkpoint.pt" in files:
+            checkpoint_path = root / "checkpoint.pt"
+        if spect_scaler_path is None and "StandardizeSpect" in files:
+            spect_scaler_path = root / "StandardizeSpect"
+        if labelmap_path is None and "labelmap.json" in files:
+            labelmap_path = root / "labelmap.json"
+        if checkpoint_path and spect_scaler_path and labelmap_path:
+            break
+    if checkpoint_path is None or spect_scaler_path is None or labelmap_path is None:
+        raise FileNotFoundError(
+            f"did not find checkpoint, SpectScaler, and labelmap in results_dir: {results_dir}\n"
+            f"checkpoint_path: {checkpoint_path}, spect_scaler_path: {spect_scaler_path}, "
+            f"labelmap_path: {labelmap_path}"
+        )
+    return checkpoint_path, spect_scaler_path, labelmap_path
 
 
 def fix_options_in_configs(config_paths, command):
@@ -175,53 +286,42 @@ def fix_options_in_configs(config_paths, command):
     """
     # split configs into train and predict or eval configs
     configs_to_fix = [config for config in config_paths if command in config.name]
-    train_configs = [config for config in config_paths if "train" in config.name]
+    # map each train config's filename 'suffix' to its path once,
+    # so the loop below finds the matching train config with one dict
+    # lookup instead of re-splitting every train config name per config
+    train_by_suffix = {
+        config.name.split("train")[1]: config
+        for config in config_paths
+        if "train" in config.name
+    }
 
     for config_to_fix in configs_to_fix:
         # figure out which 'train' config corresponds to this 'predict' or 'eval' config
         # by using 'suffix' of config file names. `train` suffix will match `predict`/'eval' suffix
         prefix, suffix = config_to_fix.name.split(command)
-        train_config_to_use = []
-        for train_config in train_configs:
-            train_prefix, train_suffix = train_config.name.split("train")
-            if train_suffix == suffix:
-                train_config_to_use.append(train_config)
-        if len(train_config_to_use) != 1:
+        try:
+            train_config_to_use = train_by_suffix[suffix]
+        except KeyError as e:
             raise ValueError(
                 f"did not find just a single train config that matches with predict config:\n"
                 f"{config_to_fix}"
-                f"Matches were: {train_config_to_use}"
-            )
-        train_config_to_use = train_config_to_use[0]
-
-        # now use the config to find the results dir and get the values for the options we need to set
-        # which are checkpoint_path, spect_scaler_path, and labelmap_path
-        with train_config_to_use.open("r") as fp:
-            train_config_toml = toml.load(fp)
-        root_results_dir = Path(train_config_toml["TRAIN"]["root_results_dir"])
-        results_dir = sorted(root_results_dir.glob("results_*"))
-        if len(results_dir) != 1:
-            raise ValueError(
-                f"did not find just a single results directory in root_results_dir from train_config:\n"
-                f"{train_config_to_use}"
-                f"root_results_dir was: {root_results_dir}"
-                f'Matches for "results_*" were: {results_dir}'
-            )
-        results_dir = results_dir[0]
+            ) from e
+
+        # now use the config to find the results dir and get the values for the options we need to set,
+        # which are checkpoint_path, spect_scaler_path, and labelmap_path;
         # these are the only options whose values we need to change
         # and they are the same for both predict and eval
-        checkpoint_path = sorted(results_dir.glob("**/checkpoints/checkpoint.pt"))[0]
-        spect_scaler_path = sorted(results_dir.glob("StandardizeSpect"))[0]
-        labelmap_path = sorted(results_dir.glob("labelmap.json"))[0]
+        checkpoint_path, spect_scaler_path, labelmap_path = _paths_from_train_results(
+            str(train_config_to_use)
+        )
 
         # now add these values to corresponding options in predict / eval config
-        with config_to_fix.open("r") as fp:
-            config_toml = toml.load(fp)
+        config_toml = load_toml(config_to_fix)
         config_toml[command.upper()]["checkpoint_path"] = str(checkpoint_path)
         config_toml[command.upper()]["spect_scaler_path"] = str(spect_scaler_path)
         config_toml[command.upper()]["labelmap_path"] = str(labelmap_path)
-        with config_to_fix.open("w") as fp:
-            toml.dump(config_toml, fp)
+        with config_to_fix.open("wb") as fp:
+            tomli_w.dump(config_toml, fp)
 
 
 # need to run 'train' config before we run 'predict'
@@ -233,6 +333,15 @@ COMMANDS = (
     "predict",
 )
 
+# splits a config filename into (model, command, suffix) groups.
+# Longest model name first, so that a model whose name contains
+# another model's name as a substring cannot be mis-parsed.
+CONFIG_NAME_RE = re.compile(
+    rf"({'|'.join(sorted(MODELS, key=len, reverse=True))})"
+    rf"_({'|'.join(COMMANDS)})"
+    r"(.*)\.toml"
+)
+
 
 def main():
     print(
@@ -249,72 +358,77 @@ def main():
     )
     make_subdirs_in_generated(config_paths)
 
+    # index configs by model and by (model, command) in a single pass,
+    # instead of re-scanning every filename once per model x command below
+    configs_by_model = defaultdict(list)
+    configs_by_model_command = defaultdict(list)
+    for config_path in config_paths:
+        model, command, _ = CONFIG_NAME_RE.match(config_path.name).groups()
+        configs_by_model[model].append(config_path)
+        configs_by_model_command[(model, command)].append(config_path)
+
     # ---- only need to run prep once, since prep'd data is the same regardless of model ----
-    prep_config_paths = [
-        config_path
-        for config_path in config_paths
-        if config_path.name.startswith(MODELS[0])
-    ]
+    prep_config_paths = configs_by_model[MODELS[0]]
     run_prep(config_paths=prep_config_paths)
     # now add the prep csv from those configs to the corresponding config
-    # from all the other models
+    # from all the other models.
+    # map each prep config's stem-minus-model-name to its path once,
+    # so the inner loop below finds the matching prep config with a dict
+    # lookup instead of scanning prep_config_paths per model config
+    prep_by_suffix = {
+        prep_config_path.stem.replace(MODELS[0], ""): prep_config_path
+        for prep_config_path in prep_config_paths
+    }
+    # parse each prep config once here and share the dict across all the
+    # models below; the loop only reads from it, so no copies are needed
+    prep_parsed = {
+        prep_config_path: load_toml(prep_config_path)
+        for prep_config_path in prep_config_paths
+    }
     for model in MODELS[1:]:
-        model_config_paths = [
-            config_path
-            for config_path in config_paths
-            if config_path.name.startswith(model)
-        ]
+        model_config_paths = configs_by_model[model]
         for model_config_path in model_config_paths:
             # we want the same prep config for MODEL[0] which will have the
             # exact same name, but with a different model name as the "prefix"
             stem_minus_model = model_config_path.stem.replace(model, "")
-            prep_config_path = [
-                prep_config_path
-                for prep_config_path in prep_config_paths
-                if prep_config_path.stem.endswith(stem_minus_model)
-            ]
-            assert len(prep_config_path) == 1
-            prep_config_path = prep_config_path[0]
-            with prep_config_path.open("r") as fp:
-                prep_config_toml = toml.load(fp)
-            with model_config_path.open("r") as fp:
-                model_config_toml = toml.load(fp)
+            prep_config_path = prep_by_suffix[stem_minus_model]
+            prep_config_toml = prep_parsed[prep_config_path]
+            model_config_toml = load_toml(model_config_path)
             # find the section that `vak prep` added the `csv_path` to,
             # and set `csv_path` for model config to the same value in
-            # the same section for this model config
+            # the same section for this model config.
+            # only write the config back out if a `csv_path` was actually
+            # copied over, so an unchanged file is not re-serialized
+            changed = False
             for section_name, options_dict in prep_config_toml.items():
                 if "csv_path" in options_dict:
                     model_config_toml[section_name]["csv_path"] = options_dict[
                         "csv_path"
                     ]
-            with model_config_path.open("w") as fp:
-                toml.dump(model_config_toml, fp)
+                    changed = True
+            if changed:
+                with model_config_path.open("wb") as fp:
+                    tomli_w.dump(model_config_toml, fp)
 
     for model in MODELS:
         for command in COMMANDS:
             if command == "prep":
                 continue  # already ran 'prep'
             print(f"running configs for command: {command}")
-            command_config_paths = [
-                config_path
-                for config_path in config_paths
-                if config_path.name.startswith(model) and command in config_path.name
-            ]
+            command_config_paths = configs_by_model_command[(model, command)]
             print(f"using the following configs:\n{command_config_paths}")
             if command == "predict" or command == "eval":
                 # fix values for required options in predict / eval configs
                 # using results from running the corresponding train configs.
                 # this only works if we ran the train configs already,
                 # which we should have because of ordering of COMMANDS constant above
-                copied_config_paths_this_model = [
-                    config_path
-                    for config_path in config_paths
-                    if config_path.name.startswith(model)
-                ]
-                fix_options_in_configs(copied_config_paths_this_model, command)
+                fix_options_in_configs(configs_by_model[model], command)
 
+            # resolve the command to its function once per command,
+            # instead of re-dispatching on the string for every config
+            command_function = vak.cli.cli.COMMAND_FUNCTION_MAP[command]
             for config_path in command_config_paths:
-                vak.cli.cli.cli(command, config_path)
+                command_function(toml_path=config_path)
 
 
 if __name__ == "__main__":
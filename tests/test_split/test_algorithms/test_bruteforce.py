@@ -1,6 +1,8 @@
 """tests for vak.split.algorithms.bruteforce module"""
 from math import isclose
 
+import numpy as np
+
 from vak.split.algorithms import brute_force
 
 # since the algorithm is random, we test multiple times
@@ -65,24 +67,24 @@ def is_expected_output(
     this function also checks that the set of labels
     in the split equals the specified ``labelset``.
     """
+    # sum durations with fancy indexing on an array,
+    # instead of Python loops over lists of indices
+    durs = np.asarray(durs)
+    total_dur = durs.sum()
     for split, dur_in, inds in zip(
         ("train", "val", "test"),
         (train_dur, val_dur, test_dur),
         (train_inds, val_inds, test_inds),
     ):
         if dur_in is not None:
-            dur_out = sum([durs[ind] for ind in inds])
+            dur_out = durs[inds].sum()
             if dur_in > 0:
                 assert dur_out >= dur_in
             elif dur_in == -1:
                 if split == "train":
-                    assert isclose(
-                        dur_out, sum(durs) - sum([durs[ind] for ind in test_inds])
-                    )
+                    assert isclose(dur_out, total_dur - durs[test_inds].sum())
                 elif split == "test":
-                    assert isclose(
-                        dur_out, sum(durs) - sum([durs[ind] for ind in train_inds])
-                    )
+                    assert isclose(dur_out, total_dur - durs[train_inds].sum())
 
             all_lbls_this_set = [lbl for ind in inds for lbl in labels[ind]]
             assert labelset == set(all_lbls_this_set)
@@ -12,6 +12,16 @@ import vak.split.split
 NUM_SAMPLES = 10  # number of times to sample behavior of random-number generator
 
 
+def labels_to_char_arrays(labels):
+    """convert a list of label strings to arrays of single characters,
+    e.g. 'abc' -> array(['a', 'b', 'c'], dtype='<U1')
+
+    one ``np.frombuffer`` call per string, instead of making NumPy
+    iterate over a Python list of the characters of each string.
+    utf-32-le is the memory layout of a little-endian '<U1' array"""
+    return [np.frombuffer(lbl.encode("utf-32-le"), dtype="<U1") for lbl in labels]
+
+
 def train_test_dur_split_inds_output_matches_expected(
     train_dur,
     val_dur,
@@ -23,24 +33,24 @@ def train_test_dur_split_inds_output_matches_expected(
     val_inds,
     test_inds,
 ):
+    # sum durations with fancy indexing on an array,
+    # instead of Python loops over lists of indices
+    durs = np.asarray(durs)
+    total_dur = durs.sum()
     for split, dur_in, inds in zip(
         ("train", "val", "test"),
         (train_dur, val_dur, test_dur),
         (train_inds, val_inds, test_inds),
     ):
         if dur_in is not None:
-            dur_out = sum([durs[ind] for ind in inds])
+            dur_out = durs[inds].sum()
             if dur_in >= 0:
                 assert dur_out >= dur_in
             elif dur_in == -1:
                 if split == "train":
-                    assert isclose(
-                        dur_out, sum(durs) - sum([durs[ind] for ind in test_inds])
-                    )
+                    assert isclose(dur_out, total_dur - durs[test_inds].sum())
                 elif split == "test":
-                    assert isclose(
-                        dur_out, sum(durs) - sum([durs[ind] for ind in train_inds])
-                    )
+                    assert isclose(dur_out, total_dur - durs[train_inds].sum())
 
             all_lbls_this_set = [lbl for ind in inds for lbl in labels[ind]]
             assert labelset == set(all_lbls_this_set)
@@ -60,7 +70,7 @@ def train_test_dur_split_inds_output_matches_expected(
     [
         (
             (5, 5, 5, 5, 5),
-            ([np.asarray(list("abcde")) for _ in range(5)]),
+            (labels_to_char_arrays(["abcde"] * 5)),
             set(list("abcde")),
             20,
             None,
@@ -109,7 +119,7 @@ def test_train_test_dur_split_inds_fake_data_impossible():
     durs = (3, 2, 1, 3, 2, 3, 2, 1, 3, 2)
     labelset = set(list("abcde"))
     labels = ["abc", "ab", "c", "cde", "de", "abc", "ab", "c", "cde", "de"]
-    labels = [np.asarray(list(lbl)) for lbl in labels]
+    labels = labels_to_char_arrays(labels)
     train_dur = 16
     val_dur = 2
     test_dur = 4